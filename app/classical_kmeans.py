@@ -28,6 +28,7 @@ def run_kmeans(X: np.ndarray, n_clusters: int = 2, max_iters: int = 10) -> Tuple
     centers: np.ndarray
         Learned cluster centers.
     """
-    model = KMeans(n_clusters=n_clusters, n_init=5, max_iter=max_iters, random_state=0)
+    # A single initialization matches the one-shot quantum loop it is compared with.
+    model = KMeans(n_clusters=n_clusters, n_init=1, max_iter=max_iters, random_state=0)
     model.fit(X)
     return model.labels_, model.cluster_centers_
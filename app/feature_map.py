@@ -4,7 +4,7 @@ A feature map turns a classical point ``x`` into a quantum state by
 encoding its values into a circuit. Different maps reshape the geometry
 of the data, which changes the similarity between points.
 """
-from typing import Iterable
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
 import numpy as np
 from qiskit import QuantumCircuit
@@ -13,6 +13,14 @@ from qiskit.circuit.library import ZZFeatureMap
 from qiskit.quantum_info import Statevector
 
 
+# Statevectors are stored in single precision; clustering only needs ~1e-6.
+STATE_DTYPE = np.complex64
+
+# Metadata key set by builders whose circuits have a closed-form statevector.
+CLOSED_FORM_KEY = "closed_form"
+ANGLE_ENCODING_NAME = "angle_encoding"
+
+
 def build_angle_encoding_map(num_qubits: int = 2) -> QuantumCircuit:
     """Create a simple angle encoding circuit.
 
@@ -30,7 +38,7 @@ def build_angle_encoding_map(num_qubits: int = 2) -> QuantumCircuit:
         A parameterized circuit ready for binding real values.
     """
     params = ParameterVector("x", length=num_qubits)
-    circuit = QuantumCircuit(num_qubits)
+    circuit = QuantumCircuit(num_qubits, name=ANGLE_ENCODING_NAME, metadata={CLOSED_FORM_KEY: ANGLE_ENCODING_NAME})
     for i, param in enumerate(params):
         # Angle encoding: rotate each qubit based on the classical feature.
         circuit.ry(param, i)
@@ -59,6 +67,119 @@ def build_zz_feature_map(num_qubits: int = 2, reps: int = 2) -> QuantumCircuit:
     return ZZFeatureMap(feature_dimension=num_qubits, reps=reps)
 
 
+def _angle_encoding_statevectors(X: np.ndarray) -> np.ndarray:
+    """Closed-form statevectors for the angle encoding map.
+
+    ``RZ(x / 2) RY(x) |0>`` on each qubit gives the amplitudes
+    ``[cos(x / 2) e^{-ix/4}, sin(x / 2) e^{ix/4}]``. The full state is the
+    Kronecker product of the single-qubit states, with qubit 0 as the
+    least significant index to match Qiskit's ordering.
+    """
+    X = np.asarray(X, dtype=float)
+    qubit_states = np.stack(
+        [np.cos(X / 2) * np.exp(-0.25j * X), np.sin(X / 2) * np.exp(0.25j * X)],
+        axis=-1,
+    ).astype(STATE_DTYPE)
+    states = qubit_states[:, 0]
+    for q in range(1, X.shape[1]):
+        states = (qubit_states[:, q, :, None] * states[:, None, :]).reshape(len(X), -1)
+    return states
+
+
+def _is_unmodified_angle_encoding(circuit: QuantumCircuit) -> bool:
+    """Check that a circuit still has exactly the angle encoding gates."""
+    params = list(circuit.parameters)
+    if len(params) != circuit.num_qubits or len(circuit.data) != 2 * circuit.num_qubits:
+        return False
+    if circuit.global_phase != 0:
+        return False
+    expected = []
+    for i, param in enumerate(params):
+        expected.append(("ry", i, param))
+        expected.append(("rz", i, param / 2))
+    for instruction, (name, qubit, angle) in zip(circuit.data, expected):
+        operation = instruction.operation
+        if operation.name != name or len(instruction.qubits) != 1:
+            return False
+        if circuit.find_bit(instruction.qubits[0]).index != qubit or operation.params[0] != angle:
+            return False
+    return True
+
+
+# Closed-form encoders keyed by the builder's metadata marker. Each entry
+# pairs the encoder with a check that the circuit was not modified after
+# it was built.
+_CLOSED_FORM_ENCODERS: Dict[
+    str, Tuple[Callable[[np.ndarray], np.ndarray], Callable[[QuantumCircuit], bool]]
+] = {
+    ANGLE_ENCODING_NAME: (_angle_encoding_statevectors, _is_unmodified_angle_encoding),
+}
+
+
+def _closed_form_encoder(
+    feature_map: QuantumCircuit, n_features: int
+) -> Optional[Callable[[np.ndarray], np.ndarray]]:
+    """Return the closed-form encoder for a feature map, if it applies."""
+    marker = (feature_map.metadata or {}).get(CLOSED_FORM_KEY)
+    if marker not in _CLOSED_FORM_ENCODERS or n_features != feature_map.num_qubits:
+        return None
+    encoder, is_unmodified = _CLOSED_FORM_ENCODERS[marker]
+    return encoder if is_unmodified(feature_map) else None
+
+
+def has_closed_form(feature_map: QuantumCircuit, n_features: int) -> bool:
+    """Whether points with ``n_features`` values skip simulation for this map.
+
+    Transpiling rewrites the ``ry``/``rz`` gates, so the structural check
+    fails and the map would be simulated; callers should check this before
+    transpiling a feature map.
+    """
+    return _closed_form_encoder(feature_map, n_features) is not None
+
+
+def _simulate_point(feature_map: QuantumCircuit, x: np.ndarray) -> np.ndarray:
+    """Bind one point to the circuit and return its simulated amplitudes.
+
+    Features beyond the circuit's parameter count are ignored.
+    """
+    # Values are assigned positionally, in ``feature_map.parameters`` order;
+    # this skips building a parameter dict for every point.
+    values = np.asarray(x, dtype=float)[: feature_map.num_parameters]
+    bound_circuit = feature_map.assign_parameters(values, inplace=False)
+    return Statevector.from_instruction(bound_circuit).data
+
+
+def encode_batch_to_statevectors(feature_map: QuantumCircuit, X: np.ndarray) -> np.ndarray:
+    """Encode every row of ``X`` into a statevector.
+
+    Unmodified maps from builders with a closed form are evaluated over the
+    whole batch with NumPy when ``X`` has one feature per qubit.
+    Other circuits are simulated one point at a time; pass an already
+    transpiled circuit to avoid decomposing it for every point.
+
+    Parameters
+    ----------
+    feature_map: QuantumCircuit
+        Circuit with free parameters representing the feature map.
+    X: np.ndarray
+        Array of shape (n_samples, n_features) with the points to encode.
+
+    Returns
+    -------
+    np.ndarray
+        Complex64 array of shape (n_samples, 2**num_qubits).
+    """
+    X = np.asarray(X, dtype=float)
+    closed_form = _closed_form_encoder(feature_map, X.shape[1])
+    if closed_form is not None:
+        return closed_form(X)
+
+    states = np.empty((len(X), 2**feature_map.num_qubits), dtype=STATE_DTYPE)
+    for i, x in enumerate(X):
+        states[i] = _simulate_point(feature_map, x)
+    return states
+
+
 def encode_to_statevector(feature_map: QuantumCircuit, x: Iterable[float]) -> np.ndarray:
     """Bind data to a feature map and simulate its statevector.
 
@@ -72,10 +193,10 @@ def encode_to_statevector(feature_map: QuantumCircuit, x: Iterable[float]) -> np
     Returns
     -------
     np.ndarray
-        Statevector amplitudes as a complex NumPy array.
+        Statevector amplitudes as a complex64 NumPy array.
     """
-    # Bind values to parameters in the order they appear.
-    bound_circuit = feature_map.bind_parameters({p: float(val) for p, val in zip(feature_map.parameters, x)})
+    closed_form = _closed_form_encoder(feature_map, len(np.asarray(x, dtype=float)))
+    if closed_form is not None:
+        return closed_form(np.atleast_2d(np.asarray(x, dtype=float)))[0]
     # Use the statevector simulator to obtain the final quantum state.
-    state = Statevector.from_instruction(bound_circuit)
-    return np.array(state.data)
+    return np.asarray(_simulate_point(feature_map, x), dtype=STATE_DTYPE)
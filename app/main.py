@@ -12,6 +12,7 @@ from .classical_kmeans import run_kmeans
 from .dataset import make_circles_data, make_moons_data
 from .feature_map import build_angle_encoding_map, build_zz_feature_map
 from .plots import (
+    build_boundary_mesh,
     plot_cluster_boundaries,
     plot_cluster_center_comparison,
     plot_original_data,
@@ -77,13 +78,23 @@ def main() -> None:
 
     # 5) Create SVG plots for comparison.
     plot_original_data(X, output_dir / "original_data.svg", y_true=y_true)
-    plot_cluster_boundaries(X, q_labels, q_centers, output_dir / "quantum_clustering_boundaries.svg", "Quantum clustering")
+    # Both boundary plots cover the same data, so share one mesh.
+    mesh = build_boundary_mesh(X)
+    plot_cluster_boundaries(
+        X,
+        q_labels,
+        q_centers,
+        output_dir / "quantum_clustering_boundaries.svg",
+        "Quantum clustering",
+        mesh=mesh,
+    )
     plot_cluster_boundaries(
         X,
         c_labels,
         c_centers,
         output_dir / "classical_kmeans_boundaries.svg",
         "Classical k-means",
+        mesh=mesh,
     )
     plot_cluster_center_comparison(
         q_centers, c_centers, output_dir / "cluster_centers_comparison.svg"
@@ -2,15 +2,31 @@
 
 SVG output keeps the repository lightweight and review-friendly.
 """
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.colors import ListedColormap
 
-# Ensure SVG backend is used when running scripts.
-plt.switch_backend("Agg")
+
+@lru_cache(maxsize=None)
+def _get_plt():
+    """Import pyplot on first use so importing this module stays cheap."""
+    import matplotlib.pyplot as plt
+
+    # Ensure SVG backend is used when running scripts.
+    plt.switch_backend("Agg")
+    return plt
+
+
+@lru_cache(maxsize=None)
+def _get_cluster_cmaps():
+    """Build the boundary and point colormaps once and reuse them."""
+    from matplotlib.colors import ListedColormap
+
+    cmap_light = ListedColormap(["#F1C40F", "#3498DB", "#E74C3C", "#2ECC71"])
+    cmap_bold = ListedColormap(["#F39C12", "#2980B9", "#C0392B", "#27AE60"])
+    return cmap_light, cmap_bold
 
 
 def _ensure_parent_dir(path: Path) -> None:
@@ -30,6 +46,7 @@ def plot_original_data(X: np.ndarray, output_path: str, y_true: Optional[np.ndar
     y_true: Optional[np.ndarray]
         Optional labels for coloring the points.
     """
+    plt = _get_plt()
     path = Path(output_path)
     _ensure_parent_dir(path)
     plt.figure(figsize=(5, 4))
@@ -42,38 +59,65 @@ def plot_original_data(X: np.ndarray, output_path: str, y_true: Optional[np.ndar
     plt.close()
 
 
+def build_boundary_mesh(X: np.ndarray, resolution: int = 80) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Build the grid used to draw decision boundaries around ``X``.
+
+    Parameters
+    ----------
+    X: np.ndarray
+        Input coordinates the grid should cover.
+    resolution: int
+        Number of grid points along each axis. Nearest-center regions are
+        bounded by straight lines, so a coarse grid already renders cleanly.
+
+    Returns
+    -------
+    xx, yy: np.ndarray
+        Mesh coordinates as returned by ``np.meshgrid``.
+    grid_points: np.ndarray
+        Flattened grid of shape (n_grid_points, 2).
+    """
+    x_min, x_max = X[:, 0].min() - 0.5, X[:, 0].max() + 0.5
+    y_min, y_max = X[:, 1].min() - 0.5, X[:, 1].max() + 0.5
+    xx, yy = np.meshgrid(np.linspace(x_min, x_max, resolution), np.linspace(y_min, y_max, resolution))
+    grid_points = np.c_[xx.ravel(), yy.ravel()]
+    return xx, yy, grid_points
+
+
 def plot_cluster_boundaries(
     X: np.ndarray,
     labels: np.ndarray,
     centers: np.ndarray,
     output_path: str,
     title: str,
+    mesh: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
 ) -> None:
     """Visualize clustering result with decision boundaries.
 
     A dense grid is colored based on the assigned cluster labels. The
-    colors show how the distance metric partitions the space.
+    colors show how the distance metric partitions the space. Pass a
+    ``mesh`` from :func:`build_boundary_mesh` to reuse it across plots.
     """
+    plt = _get_plt()
     path = Path(output_path)
     _ensure_parent_dir(path)
 
-    # Build a mesh grid.
-    x_min, x_max = X[:, 0].min() - 0.5, X[:, 0].max() + 0.5
-    y_min, y_max = X[:, 1].min() - 0.5, X[:, 1].max() + 0.5
-    xx, yy = np.meshgrid(np.linspace(x_min, x_max, 200), np.linspace(y_min, y_max, 200))
+    xx, yy, grid_points = mesh if mesh is not None else build_boundary_mesh(X)
 
     # Simple nearest-center coloring using the provided labels/centers.
     # This mirrors the last assignment step used to generate labels.
-    grid_points = np.c_[xx.ravel(), yy.ravel()]
-    closest = np.argmin(((grid_points[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2), axis=1)
+    # Expand ||a - b||^2 = ||a||^2 + ||b||^2 - 2 a.b to avoid a (points, k, 2) temporary.
+    grid_sq = (grid_points**2).sum(axis=1, keepdims=True)
+    centers_sq = (centers**2).sum(axis=1)
+    sq_distances = grid_sq + centers_sq[None, :] - 2 * grid_points @ centers.T
+    closest = np.argmin(sq_distances, axis=1)
     closest = closest.reshape(xx.shape)
 
-    cmap_light = ListedColormap(["#F1C40F", "#3498DB", "#E74C3C", "#2ECC71"])
-    cmap_bold = ["#F39C12", "#2980B9", "#C0392B", "#27AE60"]
+    cmap_light, cmap_bold = _get_cluster_cmaps()
 
     plt.figure(figsize=(5, 4))
     plt.contourf(xx, yy, closest, cmap=cmap_light, alpha=0.5)
-    plt.scatter(X[:, 0], X[:, 1], c=labels, cmap=ListedColormap(cmap_bold), edgecolor="k")
+    plt.scatter(X[:, 0], X[:, 1], c=labels, cmap=cmap_bold, edgecolor="k")
     plt.scatter(centers[:, 0], centers[:, 1], c="black", marker="x", s=80, label="Centers")
     plt.title(title)
     plt.xlabel("x1")
@@ -88,6 +132,7 @@ def plot_cluster_center_comparison(
     centers_quantum: np.ndarray, centers_classical: np.ndarray, output_path: str
 ) -> None:
     """Plot quantum vs classical cluster centers on the same axes."""
+    plt = _get_plt()
     path = Path(output_path)
     _ensure_parent_dir(path)
     plt.figure(figsize=(5, 4))
@@ -5,23 +5,104 @@ with a quantum distance derived from fidelity. Cluster centers are kept
 in classical space to keep the code lightweight, but similarity is
 computed after encoding points and centers with a quantum feature map.
 """
-from typing import Callable, Iterable, Tuple
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
 import numpy as np
+from qiskit import transpile
 
-from .feature_map import encode_to_statevector
-from .quantum_distance import quantum_distance
+from .feature_map import encode_batch_to_statevectors, has_closed_form
+from .quantum_distance import fidelity_matrix
 
 
-def _encode_points(feature_map, points: np.ndarray) -> np.ndarray:
-    """Encode a batch of points into quantum statevectors."""
-    return np.array([encode_to_statevector(feature_map, x) for x in points])
+def _encode_points(
+    circuit, points: np.ndarray, cache: Optional[Dict[bytes, np.ndarray]] = None
+) -> np.ndarray:
+    """Encode a batch of points into quantum statevectors.
 
+    When ``cache`` is given, it maps the raw bytes of a point to its
+    statevector so duplicate points are only encoded once. A cache must
+    only be shared between calls that use the same ``circuit``.
+    """
+    if cache is None:
+        return encode_batch_to_statevectors(circuit, points)
+
+    points = np.asarray(points, dtype=np.float64)
+    keys = [x.tobytes() for x in points]
+    missing = {}
+    for i, key in enumerate(keys):
+        if key not in cache and key not in missing:
+            missing[key] = i
+    if missing:
+        new_states = encode_batch_to_statevectors(circuit, points[list(missing.values())])
+        cache.update(zip(missing.keys(), new_states))
+    return np.array([cache[key] for key in keys])
+
+
+def _encode_points_for_centers(
+    circuit,
+    centers: np.ndarray,
+    center_indices: np.ndarray,
+    data_states: np.ndarray,
+    cache: Optional[Dict[bytes, np.ndarray]] = None,
+) -> np.ndarray:
+    """Encode centers, reusing data statevectors for centers taken from ``X``.
+
+    ``center_indices[k]`` is the row of ``X`` that center ``k`` was copied
+    from, or ``-1`` if the center is a computed mean.
+    """
+    from_data = center_indices >= 0
+    center_states = np.empty((len(centers), data_states.shape[1]), dtype=data_states.dtype)
+    center_states[from_data] = data_states[center_indices[from_data]]
+    if not from_data.all():
+        center_states[~from_data] = _encode_points(circuit, centers[~from_data], cache)
+    return center_states
+
+
+def _initialize_centers(
+    X: np.ndarray, n_clusters: int, rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Pick initial centers randomly from the data points.
 
-def _initialize_centers(X: np.ndarray, n_clusters: int, rng: np.random.Generator) -> np.ndarray:
-    """Pick initial centers randomly from the data points."""
+    Returns the centers together with the indices of the chosen points.
+    """
     indices = rng.choice(len(X), size=n_clusters, replace=False)
-    return X[indices]
+    return X[indices], indices
+
+
+def _update_centers(
+    X: np.ndarray, labels: np.ndarray, n_clusters: int, rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Move each center to the mean of its assigned points.
+
+    Returns the new centers and, per center, the row of ``X`` it was
+    re-sampled from when its cluster was empty, or ``-1`` for a mean.
+    """
+    # Sums and counts for every cluster are gathered in a single pass.
+    sums = np.zeros((n_clusters, X.shape[1]))
+    np.add.at(sums, labels, X)
+    counts = np.bincount(labels, minlength=n_clusters)
+    centers = sums / np.maximum(counts, 1)[:, None]
+    center_indices = np.full(n_clusters, -1)
+    empty = counts == 0
+    if empty.any():
+        # If a cluster is empty, re-sample a point to keep progress.
+        center_indices[empty] = rng.integers(0, len(X), size=int(empty.sum()))
+        centers[empty] = X[center_indices[empty]]
+    return centers, center_indices
+
+
+def _assignments_converged(
+    labels: np.ndarray, prev_labels: Optional[np.ndarray], center_indices: np.ndarray
+) -> bool:
+    """Whether the loop can stop after this assignment step.
+
+    Assignments must be unchanged and every center must be the mean of its
+    cluster, so another update would not move it. A center that was just
+    re-sampled for an empty cluster is not a mean, so the loop keeps going.
+    """
+    if prev_labels is None or not np.array_equal(labels, prev_labels):
+        return False
+    return bool((center_indices < 0).all())
 
 
 def quantum_kmeans(
@@ -56,33 +137,36 @@ def quantum_kmeans(
     rng = np.random.default_rng(random_state)
     # Build feature map once and reuse it for all encodings.
     feature_map = feature_map_builder() if feature_map_builder else None
-    centers = _initialize_centers(X, n_clusters, rng)
+    if has_closed_form(feature_map, X.shape[1]):
+        # Closed-form maps never simulate. Transpiling would rewrite their
+        # gates, fail the structural check, and force simulation.
+        circuit = feature_map
+    else:
+        # Transpile once so library blocks are not re-decomposed for every point.
+        circuit = transpile(feature_map, basis_gates=["u", "cx"], optimization_level=0)
+    centers, center_indices = _initialize_centers(X, n_clusters, rng)
     labels = np.zeros(len(X), dtype=int)
+    prev_labels = None
+    # Memo of encoded points for this run only, so it never outlives the circuit.
+    state_cache: Dict[bytes, np.ndarray] = {}
+    # Data points never move, so encode them once for all iterations.
+    data_states = _encode_points(circuit, X, state_cache)
 
     for _ in range(max_iters):
-        # Encode all data points once per iteration to keep things fast.
-        data_states = _encode_points(feature_map, X)
-        center_states = _encode_points(feature_map, centers)
+        center_states = _encode_points_for_centers(
+            circuit, centers, center_indices, data_states, state_cache
+        )
 
         # Assignment step: pick the closest center using quantum distance.
-        for i, state in enumerate(data_states):
-            distances = [quantum_distance(state, c_state) for c_state in center_states]
-            labels[i] = int(np.argmin(distances))
+        # The smallest distance ``1 - fidelity`` is the largest fidelity.
+        similarities = fidelity_matrix(data_states, center_states)
+        labels = np.argmax(similarities, axis=1)
 
-        # Update step: move centers to the mean of assigned points.
-        new_centers = np.zeros_like(centers)
-        for k in range(n_clusters):
-            cluster_points = X[labels == k]
-            if len(cluster_points) == 0:
-                # If a cluster is empty, re-sample a point to keep progress.
-                new_centers[k] = X[rng.integers(0, len(X))]
-            else:
-                new_centers[k] = cluster_points.mean(axis=0)
-
-        if np.allclose(new_centers, centers):
-            # Stop early if centers have stabilized.
-            centers = new_centers
+        if _assignments_converged(labels, prev_labels, center_indices):
             break
-        centers = new_centers
+        prev_labels = labels
+
+        # Update step: move centers to the mean of assigned points.
+        centers, center_indices = _update_centers(X, labels, n_clusters, rng)
 
     return labels, centers
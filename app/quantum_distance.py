@@ -23,6 +23,9 @@ def fidelity(state1: np.ndarray, state2: np.ndarray) -> float:
     float
         Value in [0, 1] where 1 means identical states.
     """
+    if state1 is state2:
+        # A normalized state always overlaps perfectly with itself.
+        return 1.0
     overlap = np.vdot(state1, state2)
     return float(np.abs(overlap) ** 2)
 
@@ -36,13 +39,40 @@ def quantum_distance(state1: np.ndarray, state2: np.ndarray) -> float:
     return 1.0 - fidelity(state1, state2)
 
 
-def compute_quantum_kernel(statevectors: np.ndarray) -> np.ndarray:
+def fidelity_matrix(states_a: np.ndarray, states_b: np.ndarray) -> np.ndarray:
+    """Compute fidelity between every pair of rows in two state batches.
+
+    Parameters
+    ----------
+    states_a: np.ndarray
+        Array of shape (n_a, dim) where each row is a statevector.
+    states_b: np.ndarray
+        Array of shape (n_b, dim) where each row is a statevector.
+
+    Returns
+    -------
+    np.ndarray
+        Matrix F of shape (n_a, n_b) where F[i, j] = fidelity(a_i, b_j).
+    """
+    # A single complex matrix product yields all overlaps at once. ``.T`` is
+    # a view, and ``@`` measured faster than ``np.einsum`` (even with
+    # ``optimize=True``) for both the assignment and kernel shapes.
+    inner = states_a.conj() @ states_b.T
+    return inner.real**2 + inner.imag**2
+
+
+def compute_quantum_kernel(statevectors: np.ndarray, chunk_size: int = 256) -> np.ndarray:
     """Build a kernel matrix using fidelity for each pair of states.
 
+    The diagonal is set to 1 without computing it, which assumes every
+    row is a normalized statevector.
+
     Parameters
     ----------
     statevectors: np.ndarray
-        Array of shape (n_samples, dim) where each row is a statevector.
+        Array of shape (n_samples, dim) where each row is a normalized statevector.
+    chunk_size: int
+        Side length of the square blocks processed per matrix product.
 
     Returns
     -------
@@ -50,8 +80,19 @@ def compute_quantum_kernel(statevectors: np.ndarray) -> np.ndarray:
         Symmetric matrix K where K[i, j] = fidelity(state_i, state_j).
     """
     n_samples = statevectors.shape[0]
-    kernel = np.zeros((n_samples, n_samples))
-    for i in range(n_samples):
-        for j in range(n_samples):
-            kernel[i, j] = fidelity(statevectors[i], statevectors[j])
+    # Match the precision of the states (float32 for complex64 inputs).
+    kernel = np.empty((n_samples, n_samples), dtype=statevectors.real.dtype)
+    # Work in square blocks so intermediates stay small. The kernel is
+    # symmetric, so only blocks on or above the diagonal are computed and
+    # the rest are mirrored; with several blocks this skips about half the
+    # work. A single block (n_samples <= chunk_size) computes everything.
+    for row_start in range(0, n_samples, chunk_size):
+        row_stop = min(row_start + chunk_size, n_samples)
+        for col_start in range(row_start, n_samples, chunk_size):
+            col_stop = min(col_start + chunk_size, n_samples)
+            block = fidelity_matrix(statevectors[row_start:row_stop], statevectors[col_start:col_stop])
+            kernel[row_start:row_stop, col_start:col_stop] = block
+            if col_start != row_start:
+                kernel[col_start:col_stop, row_start:row_stop] = block.T
+    np.fill_diagonal(kernel, 1.0)
     return kernel
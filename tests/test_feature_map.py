@@ -1,7 +1,16 @@
 """Tests for quantum feature map utilities."""
 import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.quantum_info import Statevector
 
-from app.feature_map import build_angle_encoding_map, build_zz_feature_map, encode_to_statevector
+from app.feature_map import (
+    build_angle_encoding_map,
+    build_zz_feature_map,
+    encode_batch_to_statevectors,
+    encode_to_statevector,
+    has_closed_form,
+)
 
 
 def test_angle_encoding_state_normalized():
@@ -16,3 +25,57 @@ def test_zz_feature_map_builds():
     # Ensure parameters exist and circuit depth is reasonable.
     assert len(fmap.parameters) > 0
     assert fmap.num_qubits == 2
+
+
+def test_angle_encoding_closed_form_matches_simulation():
+    fmap = build_angle_encoding_map()
+    X = np.array([[0.1, -0.2], [1.3, 0.7], [-2.0, 0.5]])
+    states = encode_batch_to_statevectors(fmap, X)
+    assert states.dtype == np.complex64
+    for x, state in zip(X, states):
+        expected = Statevector.from_instruction(fmap.assign_parameters(x)).data
+        assert np.allclose(state, expected, atol=1e-6)
+
+
+def test_zz_batch_encoding_matches_simulation():
+    fmap = build_zz_feature_map()
+    X = np.array([[0.1, -0.2], [1.3, 0.7], [-2.0, 0.5]])
+    states = encode_batch_to_statevectors(fmap, X)
+    assert states.dtype == np.complex64
+    for x, state in zip(X, states):
+        expected = Statevector.from_instruction(fmap.assign_parameters(x)).data
+        assert np.allclose(state, expected, atol=1e-6)
+
+
+def test_zz_encoding_state_normalized():
+    fmap = build_zz_feature_map()
+    state = encode_to_statevector(fmap, [0.4, -0.3])
+    assert state.dtype == np.complex64
+    norm = np.sum(np.abs(state) ** 2)
+    assert np.isclose(norm, 1.0, atol=1e-6)
+
+
+def test_modified_angle_map_is_simulated():
+    fmap = build_angle_encoding_map()
+    fmap.h(0)
+    impostor = QuantumCircuit(2, name="angle_encoding")
+    impostor.rx(Parameter("a"), 0)
+    impostor.rx(Parameter("b"), 1)
+    X = np.array([[0.1, -0.2], [1.3, 0.7]])
+    assert has_closed_form(build_angle_encoding_map(), 2)
+    assert not has_closed_form(build_angle_encoding_map(), 3)
+    for circuit in (fmap, impostor):
+        assert not has_closed_form(circuit, 2)
+        states = encode_batch_to_statevectors(circuit, X)
+        for x, state in zip(X, states):
+            expected = Statevector.from_instruction(circuit.assign_parameters(x)).data
+            assert np.allclose(state, expected, atol=1e-6)
+
+
+def test_extra_features_are_ignored_consistently():
+    fmap = build_zz_feature_map()
+    X = np.array([[0.1, -0.2, 5.0], [1.3, 0.7, -4.0]])
+    states = encode_batch_to_statevectors(fmap, X)
+    trimmed = encode_batch_to_statevectors(fmap, X[:, :2])
+    assert np.allclose(states, trimmed, atol=1e-6)
+    assert np.allclose(encode_to_statevector(fmap, X[0]), trimmed[0], atol=1e-6)
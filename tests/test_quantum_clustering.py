@@ -1,9 +1,16 @@
 """Tests for the quantum clustering routine."""
 import numpy as np
 
+from app import quantum_clustering
 from app.dataset import make_moons_data
 from app.feature_map import build_angle_encoding_map
-from app.quantum_clustering import quantum_kmeans
+from app.quantum_clustering import (
+    _assignments_converged,
+    _encode_points,
+    _encode_points_for_centers,
+    _update_centers,
+    quantum_kmeans,
+)
 
 
 def test_quantum_kmeans_runs():
@@ -17,3 +24,66 @@ def test_quantum_kmeans_runs():
     )
     assert labels.shape == (20,)
     assert centers.shape == (2, 2)
+
+
+def test_center_encoding_reuses_data_states():
+    X, _ = make_moons_data(n_samples=10, noise=0.05)
+    fmap = build_angle_encoding_map()
+    data_states = _encode_points(fmap, X)
+    centers = np.array([X[3], [0.2, 0.4]])
+    center_states = _encode_points_for_centers(fmap, centers, np.array([3, -1]), data_states)
+    assert np.allclose(center_states, _encode_points(fmap, centers), atol=1e-6)
+
+
+def test_encode_points_cache_deduplicates():
+    X, _ = make_moons_data(n_samples=5, noise=0.05)
+    points = np.vstack([X, X[:2]])
+    fmap = build_angle_encoding_map()
+    cache = {}
+    states = _encode_points(fmap, points, cache)
+    assert len(cache) == 5
+    assert np.allclose(states, _encode_points(fmap, points), atol=1e-6)
+
+
+def test_empty_cluster_resamples_a_data_point():
+    X, _ = make_moons_data(n_samples=20, noise=0.05)
+    # The second center is far from every point, so its cluster is empty.
+    start_centers = np.array([X.mean(axis=0), [100.0, 100.0]])
+    labels = np.argmin(((X[:, None, :] - start_centers[None, :, :]) ** 2).sum(axis=2), axis=1)
+    assert not (labels == 1).any()
+
+    centers, center_indices = _update_centers(X, labels, 2, np.random.default_rng(0))
+    assert center_indices[0] == -1
+    assert np.allclose(centers[0], X.mean(axis=0))
+    assert 0 <= center_indices[1] < len(X)
+    assert np.array_equal(centers[1], X[center_indices[1]])
+
+
+def test_quantum_kmeans_stops_once_labels_are_stable(monkeypatch):
+    X, _ = make_moons_data()
+    assignment_steps = []
+    original_fidelity_matrix = quantum_clustering.fidelity_matrix
+
+    def counting_fidelity_matrix(states_a, states_b):
+        assignment_steps.append(1)
+        return original_fidelity_matrix(states_a, states_b)
+
+    monkeypatch.setattr(quantum_clustering, "fidelity_matrix", counting_fidelity_matrix)
+    labels, centers = quantum_kmeans(X, n_clusters=2, max_iters=50, feature_map_builder=build_angle_encoding_map)
+    assert len(assignment_steps) < 50
+
+    # Without the early exit, the remaining iterations must not change anything.
+    monkeypatch.setattr(quantum_clustering, "_assignments_converged", lambda *args: False)
+    full_labels, full_centers = quantum_kmeans(
+        X, n_clusters=2, max_iters=50, feature_map_builder=build_angle_encoding_map
+    )
+    assert np.array_equal(labels, full_labels)
+    assert np.allclose(centers, full_centers)
+
+
+def test_no_early_exit_right_after_resample():
+    labels = np.array([0, 0, 1, 1])
+    assert _assignments_converged(labels, labels.copy(), np.array([-1, -1]))
+    assert not _assignments_converged(labels, labels.copy(), np.array([-1, 2]))
+    assert not _assignments_converged(labels, None, np.array([-1, -1]))
+    assert not _assignments_converged(labels, np.array([0, 1, 1, 1]), np.array([-1, -1]))
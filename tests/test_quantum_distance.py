@@ -1,17 +1,53 @@
 """Tests for quantum distance calculations."""
 import numpy as np
 
-from app.feature_map import build_angle_encoding_map, encode_to_statevector
-from app.quantum_distance import fidelity, quantum_distance
+from app.feature_map import build_angle_encoding_map, encode_batch_to_statevectors, encode_to_statevector
+from app.quantum_distance import compute_quantum_kernel, fidelity, fidelity_matrix, quantum_distance
 
 
 def test_fidelity_self_is_one():
     fmap = build_angle_encoding_map()
     state = encode_to_statevector(fmap, [0.0, 0.0])
-    assert np.isclose(fidelity(state, state), 1.0, atol=1e-6)
+    assert np.isclose(fidelity(state, state.copy()), 1.0, atol=1e-6)
 
 
 def test_quantum_distance_self_is_zero():
     fmap = build_angle_encoding_map()
     state = encode_to_statevector(fmap, [0.3, -0.1])
-    assert np.isclose(quantum_distance(state, state), 0.0, atol=1e-6)
+    assert np.isclose(quantum_distance(state, state.copy()), 0.0, atol=1e-6)
+
+
+def test_fidelity_same_object_short_circuits():
+    # For an unnormalized vector the overlap would be |v|^4, so only the
+    # identity check can return exactly 1.
+    state = np.array([2.0, 0.0, 0.0, 0.0], dtype=complex)
+    assert fidelity(state, state) == 1.0
+    assert np.isclose(fidelity(state, state.copy()), 16.0)
+
+
+def test_quantum_kernel_matches_pairwise_fidelity():
+    rng = np.random.default_rng(0)
+    states = rng.normal(size=(5, 4)) + 1j * rng.normal(size=(5, 4))
+    states /= np.linalg.norm(states, axis=1, keepdims=True)
+    kernel = compute_quantum_kernel(states, chunk_size=2)
+    expected = np.array([[fidelity(a, b) for b in states] for a in states])
+    assert np.allclose(kernel, expected, atol=1e-6)
+
+
+def test_fidelity_matrix_shape_and_values():
+    fmap = build_angle_encoding_map()
+    states_a = np.array([encode_to_statevector(fmap, x) for x in [[0.1, 0.2], [0.5, -0.4], [1.0, 0.0]]])
+    states_b = states_a[:2]
+    matrix = fidelity_matrix(states_a, states_b)
+    assert matrix.shape == (3, 2)
+    assert np.isclose(matrix[1, 1], 1.0, atol=1e-6)
+    assert np.isclose(matrix[2, 0], fidelity(states_a[2], states_b[0]), atol=1e-6)
+
+
+def test_quantum_kernel_keeps_single_precision():
+    fmap = build_angle_encoding_map()
+    states = encode_batch_to_statevectors(fmap, np.array([[0.1, 0.2], [0.5, -0.4], [1.0, 0.0]]))
+    kernel = compute_quantum_kernel(states)
+    assert states.dtype == np.complex64
+    assert kernel.dtype == np.float32
+    assert compute_quantum_kernel(states.astype(np.complex128)).dtype == np.float64